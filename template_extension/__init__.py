@@ -4,15 +4,28 @@ This package provides a comprehensive template for building domain-specific
 Semantiva extensions with examples of all major component types.
 """
 
+import importlib
+
 from semantiva.registry import SemantivaExtension
-from semantiva.registry.processor_registry import ProcessorRegistry
 
-# Import main components for convenient access
-from . import data_types
-from . import operations
-from . import probes
-from . import data_io
-from . import context_processors
+# Component subpackages are imported on first attribute access (PEP 562) so
+# that importing the package for TemplateExtension alone stays cheap.
+_LAZY_SUBMODULES = {
+    "data_types",
+    "operations",
+    "probes",
+    "data_io",
+    "context_processors",
+}
+
+# Modules registered with the ProcessorRegistry by TemplateExtension.register()
+_COMPONENT_MODULES = (
+    "template_extension.data_types.data_types",
+    "template_extension.operations.operations",
+    "template_extension.probes.probes",
+    "template_extension.data_io.data_io",
+    "template_extension.context_processors.processors",
+)
 
 
 class TemplateExtension(SemantivaExtension):
@@ -34,15 +47,23 @@ class TemplateExtension(SemantivaExtension):
         This ensures components are available for both pipeline resolution and
         doctor discovery.
         """
-        ProcessorRegistry.register_modules(
-            [
-                "template_extension.data_types.data_types",
-                "template_extension.operations.operations",
-                "template_extension.probes.probes",
-                "template_extension.data_io.data_io",
-                "template_extension.context_processors.processors",
-            ]
-        )
+        from semantiva.registry.processor_registry import ProcessorRegistry
+
+        ProcessorRegistry.register_modules(_COMPONENT_MODULES)
+
+
+def __getattr__(name: str):
+    """Import and cache a component subpackage on first access."""
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Expose lazily imported subpackages for completion and introspection."""
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
 
 
 __all__ = [
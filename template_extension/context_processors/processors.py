@@ -1,17 +1,22 @@
 """Domain-neutral context processors for template extension."""
 
-from typing import List, Optional
+import datetime
+import sys
+from typing import Dict, Optional, Tuple
 
 from semantiva.logger import Logger
 from semantiva.context_processors.context_processors import ContextProcessor
 
+_now = datetime.datetime.now
+
 
 class EchoContextProcessor(ContextProcessor):
     """
     Minimal domain-free example that writes a message into the context.
     """
 
-    CONTEXT_OUTPUT_KEY = "template.echo"
+    CONTEXT_OUTPUT_KEY = sys.intern("template.echo")
+    _CONTEXT_KEYS: Tuple[str, ...] = (CONTEXT_OUTPUT_KEY,)
 
     def __init__(self, logger: Optional[Logger] = None):
         super().__init__(logger)
@@ -19,14 +24,19 @@ class EchoContextProcessor(ContextProcessor):
     def _process_logic(self, *, message: str) -> None:
         """Store the provided message in the context.
 
+        The value is a plain ``{"message": ...}`` dict: context consumers and
+        trace serialization read it as a mapping, so it is not replaced by a
+        lighter-weight carrier object.
+
         Args:
             message: The message to store in the context.
         """
         self._notify_context_update(self.CONTEXT_OUTPUT_KEY, {"message": message})
 
     @classmethod
-    def context_keys(cls) -> List[str]:
-        return [cls.CONTEXT_OUTPUT_KEY]
+    def context_keys(cls) -> Tuple[str, ...]:
+        """Return the context keys created by this processor."""
+        return cls._CONTEXT_KEYS
 
 
 class MetadataContextProcessor(ContextProcessor):
@@ -36,7 +46,20 @@ class MetadataContextProcessor(ContextProcessor):
     computational metadata, timestamps, or derived information.
     """
 
-    CONTEXT_OUTPUT_KEY = "template.metadata"
+    CONTEXT_OUTPUT_KEY = sys.intern("template.metadata")
+    _CONTEXT_KEYS: Tuple[str, ...] = (CONTEXT_OUTPUT_KEY,)
+    PROCESSOR_VERSION = "1.0.0"
+
+    # Built once per class and shared by every metadata entry it emits;
+    # treat it as read-only.
+    _PROCESSOR_INFO: Dict[str, str] = {
+        "name": "MetadataContextProcessor",
+        "version": PROCESSOR_VERSION,
+    }
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._PROCESSOR_INFO = {"name": cls.__name__, "version": cls.PROCESSOR_VERSION}
 
     def __init__(self, logger: Optional[Logger] = None):
         super().__init__(logger)
@@ -58,9 +81,7 @@ class MetadataContextProcessor(ContextProcessor):
         metadata: dict = {}
 
         if include_timestamp:
-            import datetime
-
-            metadata["timestamp"] = datetime.datetime.now().isoformat()
+            metadata["timestamp"] = _now().isoformat()
 
         if include_stats:
             # For now, we'll add basic processor info since context stats
@@ -73,15 +94,12 @@ class MetadataContextProcessor(ContextProcessor):
             metadata["custom"] = custom_metadata
 
         # Add processor information
-        metadata["processor"] = {
-            "name": self.__class__.__name__,
-            "version": "1.0.0",
-        }
+        metadata["processor"] = self._PROCESSOR_INFO
 
         # Store metadata in context
         self._notify_context_update(self.CONTEXT_OUTPUT_KEY, metadata)
 
     @classmethod
-    def context_keys(cls) -> List[str]:
-        """Return list of context keys created by this processor."""
-        return [cls.CONTEXT_OUTPUT_KEY]
+    def context_keys(cls) -> Tuple[str, ...]:
+        """Return the context keys created by this processor."""
+        return cls._CONTEXT_KEYS
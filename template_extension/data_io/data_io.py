@@ -1,6 +1,8 @@
 """Domain-neutral data I/O for template extension."""
 
+import os
 from pathlib import Path
+from typing import Set
 
 from semantiva.data_io import DataSource, DataSink, PayloadSource, PayloadSink
 from semantiva.pipeline import Payload
@@ -8,6 +10,33 @@ from semantiva.context_processors import ContextType
 from template_extension.data_types import StringDataType
 
 
+def _read_utf8(path: Path) -> str:
+    """Read a UTF-8 text file with one unbuffered read and a single decode.
+
+    Newlines are normalized the same way as ``Path.read_text``.
+    """
+    with open(path, "rb", buffering=0) as fh:
+        content = fh.read().decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _write_bytes(path: str, payload: bytes) -> None:
+    """Write ``payload`` to ``path`` with raw file descriptor calls.
+
+    The payload normally goes out in one ``os.write`` call; short writes are
+    retried until everything has been written.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 class StringDataSource(DataSource):
     """A DataSource that outputs a configurable string as StringDataType."""
 
@@ -49,14 +78,13 @@ class StringFileDataSource(DataSource):
             IOError: If the file cannot be read.
         """
         path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-
         try:
-            content = path.read_text(encoding="utf-8")
-            return StringDataType(content)
+            content = _read_utf8(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
         except Exception as e:
             raise IOError(f"Failed to read file {file_path}: {e}")
+        return StringDataType(content)
 
     @classmethod
     def output_data_type(cls):
@@ -67,6 +95,9 @@ class StringFileDataSource(DataSource):
 class StringFileSink(DataSink[StringDataType]):
     """A DataSink that writes StringDataType data to a text file."""
 
+    # Parent directories already created by this process
+    _ENSURED_DIRS: Set[str] = set()
+
     @classmethod
     def _send_data(cls, data: StringDataType, file_path: str):
         """Write string data to a file.
@@ -82,11 +113,21 @@ class StringFileSink(DataSink[StringDataType]):
         if not isinstance(data, StringDataType):
             raise TypeError("Data must be of type StringDataType")
 
-        path = Path(file_path)
+        path = os.fspath(file_path)
+        parent = os.path.dirname(path)
         try:
-            # Ensure parent directory exists
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(data.data, encoding="utf-8")
+            # Ensure parent directory exists, once per directory
+            if parent and parent not in cls._ENSURED_DIRS:
+                os.makedirs(parent, exist_ok=True)
+                cls._ENSURED_DIRS.add(parent)
+            try:
+                _write_bytes(path, data.utf8)
+            except FileNotFoundError:
+                if not parent:
+                    raise
+                # The directory was removed after it was first ensured
+                os.makedirs(parent, exist_ok=True)
+                _write_bytes(path, data.utf8)
         except Exception as e:
             raise IOError(f"Failed to write file {file_path}: {e}")
 
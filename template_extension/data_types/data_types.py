@@ -1,6 +1,8 @@
 """Domain-neutral data types for template extension."""
 
-from typing import Iterator
+from functools import cached_property
+from operator import attrgetter
+from typing import Iterable, Iterator
 from semantiva.data_types import BaseDataType, DataCollectionType
 
 
@@ -11,21 +13,39 @@ class StringDataType(BaseDataType[str]):
     for your domain-specific data.
     """
 
-    def validate(self, data: str) -> bool:
+    @property
+    def data(self) -> str:
+        """Return the wrapped string."""
+        return self._data
+
+    @data.setter
+    def data(self, data: str) -> None:
+        """Replace the wrapped string and drop values derived from it.
+
+        Args:
+            data: The new string value.
+        """
+        self._data = data
+        self.__dict__.pop("utf8", None)
+
+    @cached_property
+    def utf8(self) -> bytes:
+        """Return the UTF-8 encoding of the string, computed once per value."""
+        return self._data.encode("utf-8")
+
+    def validate(self, data: str) -> None:
         """Validate that data is a string.
 
+        The check is by exact type, so ``str`` subclasses are rejected.
+
         Args:
             data: Value to validate.
 
-        Returns:
-            bool: True if the value is a string.
-
         Raises:
             TypeError: If data is not a string.
         """
-        if not isinstance(data, str):
+        if type(data) is not str:
             raise TypeError("Data must be a string")
-        return True
 
 
 class StringDataCollection(DataCollectionType[StringDataType, list]):
@@ -40,27 +60,66 @@ class StringDataCollection(DataCollectionType[StringDataType, list]):
         """Initialize an empty collection container."""
         return []
 
+    @classmethod
+    def _from_raw(cls, items: list) -> "StringDataCollection":
+        """Wrap a list of known-good StringDataType items without re-validating.
+
+        Args:
+            items: StringDataType elements; the list is used as-is.
+        """
+        collection = cls()
+        collection._data = items
+        return collection
+
     def __iter__(self) -> Iterator[StringDataType]:
         """Iterate over the string data elements."""
         return iter(self._data)
 
+    def iter_data(self) -> Iterator[str]:
+        """Iterate over the raw string values of the elements."""
+        return map(attrgetter("_data"), self._data)
+
     def append(self, item: StringDataType) -> None:
         """Append a StringDataType item to the collection.
 
         Args:
             item: The StringDataType element to add to the collection.
 
+        Elements are checked by exact type, so subclasses of StringDataType
+        are rejected.
+
         Raises:
             TypeError: If item is not a StringDataType instance.
         """
-        if not isinstance(item, StringDataType):
+        if type(item) is not StringDataType:
             raise TypeError("Item must be of type StringDataType")
         self._data.append(item)
 
+    def extend(self, items: Iterable[StringDataType]) -> None:
+        """Append several StringDataType items with a single validation pass.
+
+        Elements are checked by exact type, as in :meth:`append`. Nothing is
+        added if any element is rejected.
+
+        Args:
+            items: The StringDataType elements to add to the collection.
+
+        Raises:
+            TypeError: If any item is not a StringDataType instance.
+        """
+        items = list(items)
+        if not all(type(item) is StringDataType for item in items):
+            raise TypeError("Items must be of type StringDataType")
+        self._data.extend(items)
+
     def __len__(self) -> int:
         """Return the number of items in the collection."""
         return len(self._data)
 
+    def __getitem__(self, index: int) -> StringDataType:
+        """Return the StringDataType element at the given index."""
+        return self._data[index]
+
     def validate(self, data):
         """Validate that all items in the collection are StringDataType instances.
 
@@ -71,5 +130,5 @@ class StringDataCollection(DataCollectionType[StringDataType, list]):
             TypeError: If any element is not a StringDataType instance.
         """
         for item in data:
-            if not isinstance(item, StringDataType):
+            if type(item) is not StringDataType:
                 raise TypeError("Data must be a list of StringDataType objects")
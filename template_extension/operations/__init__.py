@@ -4,6 +4,8 @@ from .operations import (
     StringUppercaseOperation,
     StringLowercaseOperation,
     StringConcatenateOperation,
+    StringCollectionUppercaseOperation,
+    StringCollectionLowercaseOperation,
     StringCollectionJoinOperation,
 )
 
@@ -11,5 +13,7 @@ __all__ = [
     "StringUppercaseOperation",
     "StringLowercaseOperation",
     "StringConcatenateOperation",
+    "StringCollectionUppercaseOperation",
+    "StringCollectionLowercaseOperation",
     "StringCollectionJoinOperation",
 ]
@@ -18,6 +18,20 @@ class StringOperation(DataOperation):
         return StringDataType
 
 
+class StringCollectionOperation(DataOperation):
+    """Base class for element-wise operations on StringDataCollection data."""
+
+    @classmethod
+    def input_data_type(cls):
+        """Return the expected collection input type."""
+        return StringDataCollection
+
+    @classmethod
+    def output_data_type(cls):
+        """Return the produced collection output type."""
+        return StringDataCollection
+
+
 class StringCollectionMergeOperation(DataOperation):
     """Base class for operations that merge StringDataCollection into a single StringDataType."""
 
@@ -78,6 +92,40 @@ class StringConcatenateOperation(StringOperation):
         return StringDataType(data.data + suffix)
 
 
+class StringCollectionUppercaseOperation(StringCollectionOperation):
+    """Convert every string in a StringDataCollection to uppercase."""
+
+    def _process_logic(self, data):
+        """Convert all strings in the collection to uppercase in one pass.
+
+        Args:
+            data: StringDataCollection containing input strings.
+
+        Returns:
+            StringDataCollection: New collection with uppercase strings.
+        """
+        return StringDataCollection._from_raw(
+            [StringDataType(s.upper()) for s in data.iter_data()]
+        )
+
+
+class StringCollectionLowercaseOperation(StringCollectionOperation):
+    """Convert every string in a StringDataCollection to lowercase."""
+
+    def _process_logic(self, data):
+        """Convert all strings in the collection to lowercase in one pass.
+
+        Args:
+            data: StringDataCollection containing input strings.
+
+        Returns:
+            StringDataCollection: New collection with lowercase strings.
+        """
+        return StringDataCollection._from_raw(
+            [StringDataType(s.lower()) for s in data.iter_data()]
+        )
+
+
 class StringCollectionJoinOperation(StringCollectionMergeOperation):
     """Join all items in a StringDataCollection with a separator."""
 
@@ -91,6 +139,4 @@ class StringCollectionJoinOperation(StringCollectionMergeOperation):
         Returns:
             StringDataType: New instance with joined string.
         """
-        strings = [item.data for item in data.data]
-        joined = separator.join(strings)
-        return StringDataType(joined)
+        return StringDataType(separator.join(data.iter_data()))
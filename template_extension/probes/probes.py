@@ -1,9 +1,104 @@
 """Domain-neutral probes for template extension."""
 
+from collections import Counter
+from typing import Any, Callable, Dict, Tuple
+from weakref import WeakKeyDictionary
+
 from semantiva.data_processors import DataProbe
 from template_extension.data_types import StringDataType
 
 
+def _ascii_class(predicate: Callable[[str], bool]) -> bytes:
+    """Return the ASCII bytes whose character satisfies ``predicate``."""
+    return bytes(i for i in range(128) if predicate(chr(i)))
+
+
+_ASCII_UPPER = _ascii_class(str.isupper)
+_ASCII_LOWER = _ascii_class(str.islower)
+_ASCII_DIGIT = _ascii_class(str.isdigit)
+_ASCII_SPACE = _ascii_class(str.isspace)
+
+# Analysis of the empty string; copied on return so callers may mutate it.
+_EMPTY_ANALYSIS = {
+    "value": "",
+    "length": 0,
+    "word_count": 0,
+    "character_count": 0,
+    "uppercase_count": 0,
+    "lowercase_count": 0,
+    "digit_count": 0,
+    "whitespace_count": 0,
+    "is_empty": True,
+    "is_numeric": False,
+    "is_alphabetic": False,
+    "has_uppercase": False,
+    "has_lowercase": False,
+}
+
+
+def _count_character_classes(text: str) -> Tuple[int, int, int, int]:
+    """Count uppercase, lowercase, digit and whitespace characters in ``text``.
+
+    ASCII text takes a fast path: ``bytes.translate`` deletes one character
+    class per call in C, and the count is the number of bytes removed.
+    Other text counts each distinct character once and classifies it.
+    """
+    if text.isascii():
+        raw = text.encode("ascii")
+        size = len(raw)
+        return (
+            size - len(raw.translate(None, _ASCII_UPPER)),
+            size - len(raw.translate(None, _ASCII_LOWER)),
+            size - len(raw.translate(None, _ASCII_DIGIT)),
+            size - len(raw.translate(None, _ASCII_SPACE)),
+        )
+
+    uppercase_count = lowercase_count = digit_count = whitespace_count = 0
+    for char, count in Counter(text).items():
+        if char.isupper():
+            uppercase_count += count
+        if char.islower():
+            lowercase_count += count
+        if char.isdigit():
+            digit_count += count
+        if char.isspace():
+            whitespace_count += count
+    return uppercase_count, lowercase_count, digit_count, whitespace_count
+
+
+def _analyze(text: str) -> Dict[str, Any]:
+    """Compute the StringAnalysisProbe metrics for ``text``."""
+    if not text:
+        return _EMPTY_ANALYSIS
+
+    uppercase_count, lowercase_count, digit_count, whitespace_count = (
+        _count_character_classes(text)
+    )
+
+    return {
+        "value": text,
+        "length": len(text),
+        "word_count": len(text.split()),
+        "character_count": len(text),
+        "uppercase_count": uppercase_count,
+        "lowercase_count": lowercase_count,
+        "digit_count": digit_count,
+        "whitespace_count": whitespace_count,
+        "is_empty": False,
+        "is_numeric": text.isdigit(),
+        "is_alphabetic": text.isalpha(),
+        "has_uppercase": uppercase_count > 0,
+        "has_lowercase": lowercase_count > 0,
+    }
+
+
+# Analysis results per StringDataType instance, stored with the string they
+# were computed from so that a reassigned value is re-analyzed.
+_ANALYSIS_CACHE: "WeakKeyDictionary[StringDataType, Tuple[str, Dict[str, Any]]]" = (
+    WeakKeyDictionary()
+)
+
+
 class StringProbe(DataProbe):
     """Base class for probes that process StringDataType data."""
 
@@ -19,6 +114,9 @@ class StringAnalysisProbe(StringProbe):
     def _process_logic(self, data):
         """Analyze the string and return detailed metrics.
 
+        Results are cached per StringDataType instance, so probing the same
+        instance again returns a copy of the earlier result.
+
         Args:
             data: StringDataType containing the string to analyze.
 
@@ -27,21 +125,11 @@ class StringAnalysisProbe(StringProbe):
                   character counts, word counts, and content flags.
         """
         text = data.data
-        return {
-            "value": text,
-            "length": len(text),
-            "word_count": len(text.split()),
-            "character_count": len(text),
-            "uppercase_count": sum(1 for c in text if c.isupper()),
-            "lowercase_count": sum(1 for c in text if c.islower()),
-            "digit_count": sum(1 for c in text if c.isdigit()),
-            "whitespace_count": sum(1 for c in text if c.isspace()),
-            "is_empty": len(text) == 0,
-            "is_numeric": text.isdigit() if text else False,
-            "is_alphabetic": text.isalpha() if text else False,
-            "has_uppercase": any(c.isupper() for c in text),
-            "has_lowercase": any(c.islower() for c in text),
-        }
+        cached = _ANALYSIS_CACHE.get(data)
+        if cached is None or cached[0] is not text:
+            cached = (text, _analyze(text))
+            _ANALYSIS_CACHE[data] = cached
+        return dict(cached[1])
 
 
 class StringLengthProbe(StringProbe):
@@ -0,0 +1,94 @@
+"""Shared pytest fixtures for the template extension tests."""
+
+import re
+
+import pytest
+
+from template_extension.operations import (
+    StringUppercaseOperation,
+    StringLowercaseOperation,
+    StringConcatenateOperation,
+    StringCollectionUppercaseOperation,
+    StringCollectionLowercaseOperation,
+    StringCollectionJoinOperation,
+)
+from template_extension.probes import StringAnalysisProbe, StringLengthProbe
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _register_extension():
+    """Register the template extension with Semantiva once per test session."""
+    from template_extension import TemplateExtension
+
+    TemplateExtension().register()
+
+
+@pytest.fixture(scope="session")
+def _tmp_txt_dir(tmp_path_factory):
+    """Create one scratch directory for file I/O tests per test session."""
+    return tmp_path_factory.mktemp("strio")
+
+
+@pytest.fixture
+def tmp_txt(_tmp_txt_dir, request):
+    """Return a factory mapping a file name to a path in the session scratch dir.
+
+    Names are prefixed with the requesting test's node id (module, class,
+    name and parameters), so tests never collide. Pytest removes the
+    directory itself.
+    """
+    prefix = re.sub(r"\W", "_", request.node.nodeid)
+    return lambda name: _tmp_txt_dir / f"{prefix}-{name}"
+
+
+# Processor instances are stateless, so one instance per test module is shared.
+# Tests call ``_process_logic`` on them directly, skipping the ``run``/``process``
+# wrappers (``run`` would also build a new instance per call).
+
+
+@pytest.fixture(scope="module")
+def upper_op():
+    """Return a module-scoped StringUppercaseOperation instance."""
+    return StringUppercaseOperation()
+
+
+@pytest.fixture(scope="module")
+def lower_op():
+    """Return a module-scoped StringLowercaseOperation instance."""
+    return StringLowercaseOperation()
+
+
+@pytest.fixture(scope="module")
+def concat_op():
+    """Return a module-scoped StringConcatenateOperation instance."""
+    return StringConcatenateOperation()
+
+
+@pytest.fixture(scope="module")
+def collection_upper_op():
+    """Return a module-scoped StringCollectionUppercaseOperation instance."""
+    return StringCollectionUppercaseOperation()
+
+
+@pytest.fixture(scope="module")
+def collection_lower_op():
+    """Return a module-scoped StringCollectionLowercaseOperation instance."""
+    return StringCollectionLowercaseOperation()
+
+
+@pytest.fixture(scope="module")
+def join_op():
+    """Return a module-scoped StringCollectionJoinOperation instance."""
+    return StringCollectionJoinOperation()
+
+
+@pytest.fixture(scope="module")
+def analysis_probe():
+    """Return a module-scoped StringAnalysisProbe instance."""
+    return StringAnalysisProbe()
+
+
+@pytest.fixture(scope="module")
+def length_probe():
+    """Return a module-scoped StringLengthProbe instance."""
+    return StringLengthProbe()
@@ -10,22 +10,19 @@ Context processors are tested via pipeline execution since they require
 pipeline context to function properly.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 import pytest
-import tempfile
-import os
 
 from semantiva import ContextType
-from semantiva import Pipeline, load_pipeline_from_yaml
+from semantiva import Pipeline
+from semantiva.configurations import parse_pipeline_config
+from semantiva.data_types import NoDataType
+from semantiva.pipeline import Payload
 
-# Import all template components
+# Import template components (operation and probe instances come from conftest.py)
 from template_extension.data_types import StringDataType, StringDataCollection
-from template_extension.operations import (
-    StringUppercaseOperation,
-    StringLowercaseOperation,
-    StringConcatenateOperation,
-    StringCollectionJoinOperation,
-)
-from template_extension.probes import StringAnalysisProbe, StringLengthProbe
 from template_extension.data_io import (
     StringDataSource,
     StringFileDataSource,
@@ -34,6 +31,80 @@ from template_extension.data_io import (
     StringPayloadSink,
 )
 
+# Pipeline specs shared by the pipeline tests; per-run values such as file
+# paths are supplied through the initial context.
+CONTEXT_PROCESSORS_PIPELINE = {
+    "extensions": ["template-extension"],
+    "pipeline": {
+        "nodes": [
+            {
+                "processor": "EchoContextProcessor",
+                "parameters": {"message": "Pipeline executed successfully"},
+            },
+            {
+                "processor": "MetadataContextProcessor",
+                "parameters": {
+                    "include_timestamp": True,
+                    "include_stats": True,
+                    "custom_metadata": {
+                        "operation": "test_operation",
+                        "version": "1.0",
+                    },
+                },
+            },
+            {"processor": "StringDataSource", "parameters": {"data": "test data"}},
+            {"processor": "StringFileSink"},
+        ]
+    },
+}
+
+# File paths come from the context: the source reads ``file_path`` and the
+# rename node points ``file_path`` at ``output_path`` before the sink runs.
+STRING_PROCESSING_PIPELINE = {
+    "extensions": ["template-extension"],
+    "pipeline": {
+        "nodes": [
+            {
+                "processor": "EchoContextProcessor",
+                "parameters": {"message": "String processing pipeline"},
+            },
+            {"processor": "StringFileDataSource"},
+            {"processor": "StringUppercaseOperation"},
+            {
+                "processor": "StringLengthProbe",
+                "context_key": "probes.length_result",
+            },
+            {"processor": "rename:output_path:file_path"},
+            {"processor": "StringFileSink"},
+        ]
+    },
+}
+
+
+PIPELINE_SPECS = {
+    "context_processors": CONTEXT_PROCESSORS_PIPELINE,
+    "string_processing": STRING_PROCESSING_PIPELINE,
+}
+
+
+@lru_cache(maxsize=None)
+def _pipeline_for(name: str) -> Pipeline:
+    """Build the pipeline for a named spec once and reuse it across runs."""
+    return Pipeline(parse_pipeline_config(PIPELINE_SPECS[name]))
+
+
+def _run_pipeline(name: str, **context_values):
+    """Run a named pipeline spec with an initial context.
+
+    Per-run values such as file paths are passed through the context instead of
+    being baked into the configuration.
+
+    Returns:
+        ContextType: The context after the pipeline has run.
+    """
+    payload = Payload(NoDataType(), ContextType(context_values))
+    return _pipeline_for(name).process(payload).context
+
 
 class TestDataTypes:
     """Test data type validation and behavior."""
@@ -45,102 +116,164 @@ class TestDataTypes:
         # Valid strings
         assert data.data == "abc"
 
+        # Non-strings are rejected
+        with pytest.raises(TypeError):
+            StringDataType(123)
+
+    def test_string_data_type_utf8_cache(self):
+        """StringDataType caches its UTF-8 bytes until the value changes."""
+        data = StringDataType("héllo")
+        assert data.utf8 == "héllo".encode("utf-8")
+        assert data.utf8 is data.utf8
+
+        data.data = "world"
+        assert data.utf8 == b"world"
+
     def test_string_collection_validation(self):
         """StringDataCollection accepts lists of strings."""
-        collection_type = StringDataCollection._initialize_empty()
-        collection_type.append(StringDataType("single"))
-        collection_type.append(StringDataType("another"))
+        collection = StringDataCollection(
+            [StringDataType("single"), StringDataType("another")]
+        )
 
         # Valid collections
-        assert collection_type[0].data == "single"
-        assert collection_type[1].data == "another"
+        assert collection[0].data == "single"
+        assert collection[1].data == "another"
+
+    def test_string_collection_extend(self):
+        """StringDataCollection.extend adds items or rejects the whole batch."""
+        collection = StringDataCollection([StringDataType("a")])
+        collection.extend([StringDataType("b"), StringDataType("c")])
+        assert list(collection.iter_data()) == ["a", "b", "c"]
+
+        with pytest.raises(TypeError):
+            collection.extend([StringDataType("d"), "not wrapped"])
+        assert len(collection) == 3
 
 
 class TestOperations:
     """Test data transformation operations."""
 
-    def test_string_uppercase_operation(self):
+    @pytest.mark.parametrize(
+        "text,expected",
+        [("hello world", "HELLO WORLD"), ("MiXeD cAsE", "MIXED CASE")],
+    )
+    def test_string_uppercase_operation(self, upper_op, text, expected):
         """StringUppercaseOperation converts strings to uppercase."""
-        operation = StringUppercaseOperation()
-
-        result = operation.run(StringDataType("hello world"))
-        assert result.data == "HELLO WORLD"
+        assert upper_op._process_logic(StringDataType(text)).data == expected
 
-        result = operation.run(StringDataType("MiXeD cAsE"))
-        assert result.data == "MIXED CASE"
-
-    def test_string_lowercase_operation(self):
+    @pytest.mark.parametrize(
+        "text,expected",
+        [("HELLO WORLD", "hello world"), ("MiXeD cAsE", "mixed case")],
+    )
+    def test_string_lowercase_operation(self, lower_op, text, expected):
         """StringLowercaseOperation converts strings to lowercase."""
-        operation = StringLowercaseOperation()
-
-        result = operation.run(StringDataType("HELLO WORLD"))
-        assert result.data == "hello world"
+        assert lower_op._process_logic(StringDataType(text)).data == expected
 
-        result = operation.run(StringDataType("MiXeD cAsE"))
-        assert result.data == "mixed case"
-
-    def test_string_concatenate_operation(self):
+    @pytest.mark.parametrize(
+        "text,suffix,expected",
+        [("hello", " world", "hello world"), (" ", "test", " test")],
+    )
+    def test_string_concatenate_operation(self, concat_op, text, suffix, expected):
         """StringConcatenateOperation joins two strings with space."""
-        operation = StringConcatenateOperation()
-
-        result = operation.run(StringDataType("hello"), suffix=" world")
-        assert result.data == "hello world"
-
-        result = operation.run(StringDataType(" "), suffix="test")
-        assert result.data == " test"
-
-    def test_string_collection_join_operation(self):
-        """StringCollectionJoinOperation joins string lists with commas."""
-        operation = StringCollectionJoinOperation()
-
-        result = operation.run(
-            StringDataCollection(
-                [
-                    StringDataType("apple"),
-                    StringDataType("banana"),
-                    StringDataType("cherry"),
-                ]
-            )
+        result = concat_op._process_logic(StringDataType(text), suffix=suffix)
+        assert result.data == expected
+
+    def test_string_collection_case_operations(
+        self, collection_upper_op, collection_lower_op
+    ):
+        """Collection case operations convert every element in one call."""
+        collection = StringDataCollection(
+            [StringDataType("Hello"), StringDataType("wOrLd")]
         )
-        assert result.data == "apple banana cherry"
-
-        result = operation.run(StringDataCollection([StringDataType("single")]))
-        assert result.data == "single"
 
-        result = operation.run(StringDataCollection([]))
-        assert result.data == ""
+        result = collection_upper_op._process_logic(collection)
+        assert isinstance(result, StringDataCollection)
+        assert list(result.iter_data()) == ["HELLO", "WORLD"]
+
+        result = collection_lower_op._process_logic(collection)
+        assert list(result.iter_data()) == ["hello", "world"]
+
+    @pytest.mark.parametrize(
+        "items,expected",
+        [
+            ([], ""),
+            (["single"], "single"),
+            (["apple", "banana", "cherry"], "apple banana cherry"),
+        ],
+    )
+    def test_string_collection_join_operation(self, join_op, items, expected):
+        """StringCollectionJoinOperation joins string lists with spaces."""
+        collection = StringDataCollection([StringDataType(item) for item in items])
+        assert join_op._process_logic(collection).data == expected
+
+
+# Expected StringAnalysisProbe output for "Hello World!"
+_EXPECTED_ANALYSIS = MappingProxyType(
+    {
+        "value": "Hello World!",
+        "length": 12,
+        "word_count": 2,
+        "character_count": 12,
+        "uppercase_count": 2,
+        "lowercase_count": 8,
+        "digit_count": 0,
+        "whitespace_count": 1,
+        "is_empty": False,
+        "is_numeric": False,
+        "is_alphabetic": False,
+        "has_uppercase": True,
+        "has_lowercase": True,
+    }
+)
 
 
 class TestProbes:
     """Test data analysis probes."""
 
-    def test_string_analysis_probe(self):
+    def test_string_analysis_probe(self, analysis_probe):
         """StringAnalysisProbe extracts detailed string metrics."""
 
-        result = StringAnalysisProbe.run(StringDataType("Hello World!"))
-        expected = {
-            "value": "Hello World!",
-            "length": 12,
-            "word_count": 2,
-            "character_count": 12,
-            "uppercase_count": 2,
-            "lowercase_count": 8,
-            "digit_count": 0,
-            "whitespace_count": 1,
-            "is_empty": False,
-            "is_numeric": False,
-            "is_alphabetic": False,
-            "has_uppercase": True,
-            "has_lowercase": True,
-        }
-        assert result == expected
+        result = analysis_probe._process_logic(StringDataType("Hello World!"))
+        assert result == _EXPECTED_ANALYSIS
+
+    def test_string_analysis_probe_cache(self, analysis_probe):
+        """StringAnalysisProbe reuses results until the value changes."""
 
-    def test_string_length_probe(self):
+        data = StringDataType("abc")
+        first = analysis_probe._process_logic(data)
+        first["length"] = -1  # callers get copies, not the cached dict
+        assert analysis_probe._process_logic(data)["length"] == 3
+
+        data.data = "ABCD"
+        assert analysis_probe._process_logic(data)["uppercase_count"] == 4
+
+    def test_string_analysis_probe_empty_string(self, analysis_probe):
+        """StringAnalysisProbe reports zero counts for the empty string."""
+
+        result = analysis_probe._process_logic(StringDataType(""))
+        assert result["value"] == ""
+        assert result["is_empty"]
+        assert not result["is_numeric"] and not result["is_alphabetic"]
+        assert result["length"] == result["word_count"] == 0
+        assert result["uppercase_count"] == result["whitespace_count"] == 0
+
+    def test_string_analysis_probe_character_classes(self, analysis_probe):
+        """StringAnalysisProbe counts character classes in non-ASCII text."""
+
+        result = analysis_probe._process_logic(StringDataType("Ab 12\tÉé\n٣"))
+        assert result["uppercase_count"] == 2
+        assert result["lowercase_count"] == 2
+        assert result["digit_count"] == 3
+        assert result["whitespace_count"] == 3
+        assert result["word_count"] == 4
+        assert result["has_uppercase"] and result["has_lowercase"]
+
+    def test_string_length_probe(self, length_probe):
         """StringLengthProbe returns string length."""
 
-        assert StringLengthProbe.run(StringDataType("hello")) == 5
-        assert StringLengthProbe.run(StringDataType("")) == 0
-        assert StringLengthProbe.run(StringDataType("a" * 100)) == 100
+        assert length_probe._process_logic(StringDataType("hello")) == 5
+        assert length_probe._process_logic(StringDataType("")) == 0
+        assert length_probe._process_logic(StringDataType("a" * 100)) == 100
 
 
 class TestDataIO:
@@ -148,47 +281,34 @@ class TestDataIO:
 
     def test_string_data_source(self):
         """StringDataSource generates configured string data."""
-        source = StringDataSource()
-
-        result = source.get_data("test string")
+        result = StringDataSource.get_data("test string")
         assert result.data == "test string"
 
-    def test_string_file_data_source(self):
+    def test_string_file_data_source(self, tmp_txt):
         """StringFileDataSource reads from file."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-            f.write("File content test")
-            temp_path = f.name
-
-        try:
-            source = StringFileDataSource()
-            result = source.get_data(file_path=temp_path)
-            assert result.data == "File content test"
-        finally:
-            os.unlink(temp_path)
-
-    def test_string_file_sink(self):
+        input_path = tmp_txt("input.txt")
+        input_path.write_text("File content test", encoding="utf-8")
+
+        result = StringFileDataSource.get_data(file_path=str(input_path))
+        assert result.data == "File content test"
+
+    def test_string_file_sink(self, tmp_txt):
         """StringFileSink writes data to file."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-            temp_path = f.name
+        output_path = tmp_txt("output.txt")
 
-        try:
-            sink = StringFileSink()
-            sink.send_data(StringDataType("test output"), file_path=temp_path)
+        StringFileSink.send_data(
+            StringDataType("test output"), file_path=str(output_path)
+        )
 
-            # Verify file content
-            with open(temp_path, "r") as f:
-                content = f.read()
-            assert content == "test output"
-        finally:
-            os.unlink(temp_path)
+        # Verify file content
+        assert output_path.read_text(encoding="utf-8") == "test output"
 
     def test_string_payload_source(self):
         """StringPayloadSource extracts string from context payload."""
         context = ContextType()
         context.set_value("payload.message", "payload test")
 
-        source = StringPayloadSource()
-        result = source.get_payload("payload test", "my_key")
+        result = StringPayloadSource.get_payload("payload test", "my_key")
         assert result.data.data == "payload test"
         assert result.context.get_value("my_key") == {
             "content_length": 12,
@@ -209,183 +329,62 @@ class TestDataIO:
         StringPayloadSink.send_payload(payload)
 
 
+# Both context processors run in one pipeline; the context processor tests
+# below share a single execution of it.
+@pytest.fixture(scope="class")
+def shared_context(_tmp_txt_dir):
+    """Run the context processor pipeline once per test class."""
+    output_path = _tmp_txt_dir / "context_processors-output.txt"
+    return _run_pipeline("context_processors", file_path=str(output_path))
+
+
 class TestContextProcessorsViaPipeline:
     """Test context processors through pipeline execution."""
 
-    def test_echo_context_processor_pipeline(self):
+    def test_echo_context_processor_pipeline(self, shared_context):
         """EchoContextProcessor adds echo metadata via pipeline."""
-        pipeline_yaml = """
-        extensions: ["template-extension"]
-        pipeline:
-          nodes:
-            - processor: EchoContextProcessor
-              parameters:
-                message: "Pipeline executed successfully"
-            - processor: StringDataSource
-              parameters:
-                data: "test data"
-            - processor: StringFileSink
-              parameters:
-                file_path: "/tmp/test_echo_output.txt"
-        """
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(pipeline_yaml)
-            config_path = f.name
-
-        try:
-            config = load_pipeline_from_yaml(config_path)
-            pipeline = Pipeline(config)
-            context = pipeline.process().context
-
-            # Verify echo metadata was added
-            echo_data = context.get_value("template.echo")
-            assert echo_data == {"message": "Pipeline executed successfully"}
-
-        finally:
-            os.unlink(config_path)
-            if os.path.exists("/tmp/test_echo_output.txt"):
-                os.unlink("/tmp/test_echo_output.txt")
-
-    def test_string_context_processor_pipeline(self):
-        """Test a simple pipeline with context processor metadata."""
-        pipeline_yaml = """
-        extensions: ["template-extension"]
-        pipeline:
-          nodes:
-            - processor: MetadataContextProcessor
-              parameters:
-                include_timestamp: true
-                include_stats: false
-            - processor: StringDataSource
-              parameters:
-                data: "test data"
-            - processor: StringFileSink
-              parameters:
-                file_path: "/tmp/test_string_output.txt"
-        """
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(pipeline_yaml)
-            config_path = f.name
-
-        try:
-            config = load_pipeline_from_yaml(config_path)
-            pipeline = Pipeline(config)
-            context = pipeline.process().context
-
-            # Verify metadata was added
-            metadata = context.get_value("template.metadata")
-            assert "timestamp" in metadata
-            assert metadata["processor"]["name"] == "MetadataContextProcessor"
-
-        finally:
-            os.unlink(config_path)
-            if os.path.exists("/tmp/test_string_output.txt"):
-                os.unlink("/tmp/test_string_output.txt")
-
-    def test_metadata_context_processor_pipeline(self):
+        echo_data = shared_context.get_value("template.echo")
+        assert echo_data == {"message": "Pipeline executed successfully"}
+
+    def test_metadata_context_processor_pipeline(self, shared_context):
         """MetadataContextProcessor adds execution metadata via pipeline."""
-        pipeline_yaml = """
-        extensions: ["template-extension"]
-        pipeline:
-          nodes:
-            - processor: MetadataContextProcessor
-              parameters:
-                include_timestamp: true
-                include_stats: true
-                custom_metadata:
-                  operation: "test_operation"
-                  version: "1.0"
-            - processor: StringDataSource
-              parameters:
-                data: "test data"
-            - processor: StringFileSink
-              parameters:
-                file_path: "/tmp/test_metadata_output.txt"
-        """
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(pipeline_yaml)
-            config_path = f.name
-
-        try:
-            config = load_pipeline_from_yaml(config_path)
-            pipeline = Pipeline(config)
-            context = pipeline.process().context
-
-            # Verify execution metadata was added
-            metadata = context.get_value("template.metadata")
-            assert "timestamp" in metadata
-            assert metadata["context_stats"]["processor_active"]
-            assert metadata["custom"]["operation"] == "test_operation"
-            assert metadata["custom"]["version"] == "1.0"
-            assert metadata["processor"]["name"] == "MetadataContextProcessor"
-
-        finally:
-            os.unlink(config_path)
-            if os.path.exists("/tmp/test_metadata_output.txt"):
-                os.unlink("/tmp/test_metadata_output.txt")
+        metadata = shared_context.get_value("template.metadata")
+        assert "timestamp" in metadata
+        assert metadata["processor"]["name"] == "MetadataContextProcessor"
+        assert metadata["context_stats"]["processor_active"]
+        assert metadata["custom"]["operation"] == "test_operation"
+        assert metadata["custom"]["version"] == "1.0"
 
 
 class TestComponentIntegration:
     """Test components working together in realistic scenarios."""
 
-    def test_complete_string_processing_pipeline(self):
+    @pytest.mark.parametrize(
+        "text,expected",
+        [("hello world", "HELLO WORLD"), ("MiXeD cAsE", "MIXED CASE")],
+    )
+    def test_complete_string_processing_pipeline(self, tmp_txt, text, expected):
         """Test a complete pipeline using multiple template components."""
-        # Create input file
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-            f.write("hello world")
-            input_path = f.name
-
-        # Create output file path
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as f:
-            output_path = f.name
-
-        pipeline_yaml = f"""
-        extensions: ["template-extension"]
-        pipeline:
-          nodes:
-            - processor: EchoContextProcessor
-              parameters:
-                message: "String processing pipeline"
-            - processor: StringFileDataSource
-              parameters:
-                file_path: "{input_path}"
-            - processor: StringUppercaseOperation
-            - processor: StringLengthProbe
-              context_key: "probes.length_result"
-            - processor: StringFileSink
-              parameters:
-                file_path: "{output_path}"
-        """
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(pipeline_yaml)
-            config_path = f.name
-
-        try:
-            config = load_pipeline_from_yaml(config_path)
-            pipeline = Pipeline(config)
-            context = pipeline.process().context
-
-            # Verify the pipeline processed correctly
-            with open(output_path, "r") as f:
-                result = f.read()
-            assert result == "HELLO WORLD"
-
-            # Verify probe result was captured with context keyword
-            probe_result = context.get_value("probes.length_result")
-            assert probe_result == 11  # Length of "HELLO WORLD"
-
-            # Verify processor added metadata
-            echo_data = context.get_value("template.echo")
-            assert echo_data == {"message": "String processing pipeline"}
-
-        finally:
-            for path in [input_path, output_path, config_path]:
-                if os.path.exists(path):
-                    os.unlink(path)
+        input_path = tmp_txt("input.txt")
+        input_path.write_text(text, encoding="utf-8")
+        output_path = tmp_txt("output.txt")
+
+        context = _run_pipeline(
+            "string_processing",
+            file_path=str(input_path),
+            output_path=str(output_path),
+        )
+
+        # Verify the pipeline processed correctly
+        assert output_path.read_text(encoding="utf-8") == expected
+
+        # Verify probe result was captured with context keyword
+        probe_result = context.get_value("probes.length_result")
+        assert probe_result == len(expected)
+
+        # Verify processor added metadata
+        echo_data = context.get_value("template.echo")
+        assert echo_data == {"message": "String processing pipeline"}
 
 
 if __name__ == "__main__":
@@ -1,5 +1,15 @@
 import os
 import re
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator; the regex is used without it
+    ahocorasick = None
 
 FORBIDDEN_TERMS = [
     "ima" "ging",
@@ -10,53 +20,210 @@ FORBIDDEN_TERMS = [
     "pix" "el",
 ]
 
-FORBIDDEN = re.compile(r"\b(" + "|".join(FORBIDDEN_TERMS) + r")\b", re.IGNORECASE)
+FORBIDDEN_PATTERN = "|".join(FORBIDDEN_TERMS)
 
+# Bytes pattern so file chunks can be searched without decoding
+FORBIDDEN = re.compile(rb"\b(" + FORBIDDEN_PATTERN.encode() + rb")\b", re.IGNORECASE)
 
-def test_no_domain_terms_present():
-    roots = ["template_extension", "tests", "pyproject.toml", "README.md"]
-    offenders = []
-    for root in roots:
-        if not os.path.exists(root):
+
+def _build_automaton():
+    """Build an Aho-Corasick automaton over the lowercase forbidden terms."""
+    automaton = ahocorasick.Automaton()
+    for term in FORBIDDEN_TERMS:
+        automaton.add_word(term.lower(), len(term))
+    automaton.make_automaton()
+    return automaton
+
+
+AUTOMATON = _build_automaton() if ahocorasick is not None else None
+
+
+def _is_word_char(char):
+    # ASCII only, matching ``\b`` in the bytes regex
+    return char.isascii() and (char.isalnum() or char == "_")
+
+
+def _find_terms(buf):
+    """Yield ``(start, end)`` spans of whole-word forbidden terms in ``buf``.
+
+    Uses the Aho-Corasick automaton when ``pyahocorasick`` is installed and
+    the precompiled regex otherwise. Both treat the edges of ``buf`` as word
+    boundaries.
+    """
+    if AUTOMATON is None:
+        for match in FORBIDDEN.finditer(buf):
+            yield match.span()
+        return
+    # latin-1 maps bytes 1:1, keeping the ASCII terms and offsets intact
+    text = buf.decode("latin-1").lower()
+    last = len(text) - 1
+    for end, length in AUTOMATON.iter(text):
+        start = end - length + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < last and _is_word_char(text[end + 1]):
             continue
+        yield start, end + 1
+
+
+# Only source-like text files are scanned; anything larger is skipped
+ALLOWED_EXTENSIONS = {
+    ".py",
+    ".md",
+    ".rst",
+    ".txt",
+    ".yaml",
+    ".yml",
+    ".toml",
+    ".cfg",
+    ".ini",
+}
+MAX_FILE_SIZE = 1 << 20
+
+# Directories that are never descended into
+SKIPPED_DIRS = {"__pycache__", ".git", ".venv", "node_modules"}
+
+THIS_FILE = os.path.abspath(__file__)
+
+# Files are read in chunks; the overlap covers the longest term plus the byte
+# before it, so every match is seen whole with its left neighbour
+CHUNK_SIZE = 64 * 1024
+CHUNK_OVERLAP = max(map(len, FORBIDDEN_TERMS)) + 1
+
+
+def _contains_forbidden(path):
+    """Stream a file in fixed-size chunks and stop at the first forbidden term.
+
+    Consecutive chunks overlap by ``CHUNK_OVERLAP`` bytes. A match touching
+    the start or end of a buffer is only trusted once the byte beyond it has
+    been read, so words split across chunks are never misreported.
+    """
+    with open(path, "rb") as fh:
+        carry = b""
+        offset = 0  # file offset of the start of ``buf``
+        while True:
+            chunk = fh.read(CHUNK_SIZE)
+            buf = carry + chunk
+            at_eof = len(chunk) < CHUNK_SIZE
+            for start, end in _find_terms(buf):
+                if (start > 0 or offset == 0) and (end < len(buf) or at_eof):
+                    return True
+            if at_eof:
+                return False
+            carry = buf[-CHUNK_OVERLAP:]
+            offset += len(buf) - len(carry)
+
+
+def _scan_with_ripgrep(roots):
+    """Return offending paths using ripgrep, or None if it is unavailable."""
+    rg = shutil.which("rg")
+    if rg is None:
+        return None
+    command = [
+        rg,
+        "--files-with-matches",
+        "--no-ignore",
+        "--hidden",
+        "--no-messages",
+        "--max-filesize",
+        "1M",
+    ]
+    for extension in sorted(ALLOWED_EXTENSIONS):
+        command += ["--glob", "*" + extension]
+    for name in sorted(SKIPPED_DIRS) + [os.path.basename(THIS_FILE)]:
+        command += ["--glob", "!" + name]
+    # ASCII-only case folding and word boundaries, matching the bytes regex
+    pattern = r"(?i-u)\b(?:" + FORBIDDEN_PATTERN + r")\b"
+    command += ["--regexp", pattern, "--", *roots]
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode not in (0, 1):
+        return None
+    return result.stdout.splitlines()
+
+
+def _iter_candidates(directory):
+    """Yield scannable files below ``directory`` using ``os.scandir``.
+
+    ``DirEntry`` caches the file type from the directory read, so only the size
+    check needs a ``stat`` call.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIPPED_DIRS:
+                    yield from _iter_candidates(entry.path)
+            elif (
+                os.path.splitext(entry.name)[1] in ALLOWED_EXTENSIONS
+                and os.path.abspath(entry.path) != THIS_FILE
+                and entry.stat().st_size <= MAX_FILE_SIZE
+            ):
+                yield entry.path
+
+
+def _scan_with_python(roots):
+    """Return offending paths by walking the roots in Python.
+
+    Files are checked on a thread pool; the scan is read-only and I/O bound,
+    and the shared regex and automaton are safe to search concurrently.
+    """
+    paths = []
+    for root in roots:
         if os.path.isdir(root):
-            for dirpath, _, files in os.walk(root):
-                if "__pycache__" in dirpath:
-                    continue
-                for f in files:
-                    path = os.path.join(dirpath, f)
-                    if os.path.abspath(path) == os.path.abspath(__file__):
-                        continue
-                    if f.endswith(
-                        (
-                            ".png",
-                            ".jpg",
-                            ".jpeg",
-                            ".pdf",
-                            ".bin",
-                            ".npy",
-                            ".npz",
-                            ".gz",
-                            ".xz",
-                            ".zip",
-                            ".ico",
-                            ".icns",
-                            ".svg",
-                            ".pyc",
-                        )
-                    ):
-                        continue
-                    with open(path, "rb") as fh:
-                        try:
-                            text = fh.read().decode("utf-8", errors="ignore")
-                        except Exception:
-                            continue
-                    if FORBIDDEN.search(text):
-                        offenders.append(path)
+            paths.extend(_iter_candidates(root))
         else:
-            with open(root, "rb") as fh:
-                text = fh.read().decode("utf-8", errors="ignore")
-            if FORBIDDEN.search(text):
-                offenders.append(root)
+            paths.append(root)
+    with ThreadPoolExecutor() as executor:
+        hits = executor.map(_contains_forbidden, paths)
+        return [path for path, hit in zip(paths, hits) if hit]
+
+
+def test_no_domain_terms_present():
+    roots = ["template_extension", "tests", "pyproject.toml", "README.md"]
+    roots = [root for root in roots if os.path.exists(root)]
+    offenders = _scan_with_ripgrep(roots)
+    if offenders is None:
+        offenders = _scan_with_python(roots)
 
     assert not offenders, f"Forbidden domain terms found in: {offenders}"
+
+
+# Word-boundary edge cases that every backend must classify the same way
+_TERM = FORBIDDEN_TERMS[-1].encode()
+BOUNDARY_SAMPLES = [
+    _TERM,
+    b"x " + _TERM + b"\xc3\xa9",
+    "\u00e9".encode() + _TERM,
+    b"_" + _TERM,
+    _TERM + b"s",
+    b"a" + _TERM,
+    _TERM.upper() + b"-1",
+    "\u00c9".encode() + _TERM.upper(),
+    b"plain text",
+]
+
+
+def test_automaton_matches_regex_backend():
+    """Both search backends agree on word boundaries, including non-ASCII."""
+    if AUTOMATON is None:
+        pytest.skip("pyahocorasick is not installed")
+
+    for sample in BOUNDARY_SAMPLES:
+        regex_spans = [match.span() for match in FORBIDDEN.finditer(sample)]
+        assert list(_find_terms(sample)) == regex_spans, sample
+
+
+def test_ripgrep_matches_python_scan(tmp_path):
+    """ripgrep reports the same files as the Python scan."""
+    if shutil.which("rg") is None:
+        pytest.skip("ripgrep is not installed")
+
+    for index, sample in enumerate(BOUNDARY_SAMPLES):
+        (tmp_path / f"sample{index}.txt").write_bytes(sample)
+
+    ripgrep_hits = _scan_with_ripgrep([str(tmp_path)])
+    assert ripgrep_hits is not None
+    python_hits = _scan_with_python([str(tmp_path)])
+    assert python_hits, "samples should include forbidden terms"
+    assert sorted(map(os.path.basename, ripgrep_hits)) == sorted(
+        map(os.path.basename, python_hits)
+    )
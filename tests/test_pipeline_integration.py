@@ -1,21 +1,26 @@
 """Integration test for template extension pipeline execution."""
 
 from pathlib import Path
+
+import pytest
 from semantiva import load_pipeline_from_yaml
 
+PIPELINE_FILE = Path(__file__).parent / "test_pipeline.yaml"
 
-def test_pipeline_yaml_can_be_loaded():
-    """Test that the pipeline YAML file is valid and can be parsed."""
 
-    # Load the test pipeline YAML
-    pipeline_file = Path(__file__).parent / "test_pipeline.yaml"
-    assert pipeline_file.exists(), "test_pipeline.yaml should exist"
+@pytest.fixture(scope="session")
+def pipeline_config():
+    """Load the test pipeline YAML once per test session."""
+    assert PIPELINE_FILE.exists(), "test_pipeline.yaml should exist"
+    return load_pipeline_from_yaml(PIPELINE_FILE)
 
-    pipeline_config = load_pipeline_from_yaml(pipeline_file)
+
+def test_pipeline_yaml_can_be_loaded(pipeline_config):
+    """Test that the pipeline YAML file is valid and can be parsed."""
 
     # Check that processors are specified
     for step in pipeline_config:
-        assert "processor" in step
+        assert isinstance(step, dict) and "processor" in step
 
 
 def test_component_types_are_complete():
@@ -30,30 +35,22 @@ def test_component_types_are_complete():
         context_processors,
     )
 
-    # Data Types
-    assert hasattr(data_types, "StringDataType")
-    assert hasattr(data_types, "StringDataCollection")
-
-    # Operations
-    assert hasattr(operations, "StringUppercaseOperation")
-    assert hasattr(operations, "StringConcatenateOperation")
-
-    # Probes
-    assert hasattr(probes, "StringAnalysisProbe")
-    assert hasattr(probes, "StringLengthProbe")
-
-    # Data I/O
-    assert hasattr(data_io, "StringDataSource")
-    assert hasattr(data_io, "StringFileSink")
-    assert hasattr(data_io, "StringPayloadSource")
-    assert hasattr(data_io, "StringPayloadSink")
-
-    # Processors
-    assert hasattr(context_processors, "EchoContextProcessor")
-    assert hasattr(context_processors, "MetadataContextProcessor")
+    required = {
+        data_types: {"StringDataType", "StringDataCollection"},
+        operations: {"StringUppercaseOperation", "StringConcatenateOperation"},
+        probes: {"StringAnalysisProbe", "StringLengthProbe"},
+        data_io: {
+            "StringDataSource",
+            "StringFileSink",
+            "StringPayloadSource",
+            "StringPayloadSink",
+        },
+        context_processors: {"EchoContextProcessor", "MetadataContextProcessor"},
+    }
+    for module, names in required.items():
+        missing = names - set(dir(module))
+        assert not missing, f"{module.__name__} is missing {sorted(missing)}"
 
 
 if __name__ == "__main__":
-    test_pipeline_yaml_can_be_loaded()
-    test_component_types_are_complete()
-    print("Pipeline integration tests passed!")
+    pytest.main([__file__, "-v"])
@@ -1,7 +1,9 @@
 """Tests for template extension pipeline functionality."""
 
-from pathlib import Path
-import tempfile
+import subprocess
+import sys
+
+import pytest
 
 
 def test_template_extension_components():
@@ -19,6 +21,7 @@ def test_template_extension_components():
     collection.append(string_data)
     collection.append(StringDataType("second string"))
     assert len(collection) == 2
+    assert list(collection.iter_data()) == ["test string", "second string"]
 
     # Test operations
     from template_extension.operations import (
@@ -64,6 +67,10 @@ def test_template_extension_context_processors():
     from semantiva.context_processors.context_observer import _ContextObserver
     from semantiva.context_processors.context_types import ContextType
 
+    # Context keys are class constants
+    assert EchoContextProcessor.context_keys() == ("template.echo",)
+    assert MetadataContextProcessor.context_keys() == ("template.metadata",)
+
     # Test echo processor
     echo_processor = EchoContextProcessor()
     context = ContextType()
@@ -92,31 +99,72 @@ def test_template_extension_context_processors():
     assert metadata["custom"]["test"] == "value"
     assert metadata["processor"]["name"] == "MetadataContextProcessor"
 
+    # Optional sections are left out when disabled
+    _ = metadata_processor.operate_context(
+        context=context,
+        context_observer=observer,
+        include_timestamp=False,
+        include_stats=False,
+    )
+    metadata = observer.observer_context.get_value("template.metadata")
+    assert "timestamp" not in metadata
+    assert "context_stats" not in metadata
+    assert "custom" not in metadata
+
+    # Subclasses report their own name
+    class CustomMetadataContextProcessor(MetadataContextProcessor):
+        pass
 
-def test_template_extension_file_io():
+    _ = CustomMetadataContextProcessor().operate_context(
+        context=context, context_observer=observer
+    )
+    metadata = observer.observer_context.get_value("template.metadata")
+    assert metadata["processor"] == {
+        "name": "CustomMetadataContextProcessor",
+        "version": "1.0.0",
+    }
+
+
+def test_template_extension_file_io(tmp_path):
     """Test file-based data I/O components."""
 
     from template_extension.data_io import StringFileDataSource, StringFileSink
     from template_extension.data_types import StringDataType
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Test file writing
-        test_file = Path(temp_dir) / "test.txt"
-        test_data = StringDataType("Test file content\nWith multiple lines")
+    # Test file writing
+    test_file = tmp_path / "test.txt"
+    test_data = StringDataType("Test file content\nWith multiple lines")
+
+    sink = StringFileSink()
+    sink._send_data(test_data, str(test_file))
+
+    # Verify file was created and has correct content
+    assert test_file.exists()
+    content = test_file.read_text(encoding="utf-8")
+    assert content == "Test file content\nWith multiple lines"
+
+    # Test file reading
+    source = StringFileDataSource()
+    loaded_data = source._get_data(str(test_file))
+    assert loaded_data.data == "Test file content\nWith multiple lines"
+    assert isinstance(loaded_data, StringDataType)
 
-        sink = StringFileSink()
-        sink._send_data(test_data, str(test_file))
+    # Line endings are normalized as with text-mode reads
+    test_file.write_bytes(b"first\r\nsecond\rthird")
+    loaded_data = source._get_data(str(test_file))
+    assert loaded_data.data == "first\nsecond\nthird"
 
-        # Verify file was created and has correct content
-        assert test_file.exists()
-        content = test_file.read_text()
-        assert content == "Test file content\nWith multiple lines"
+    # Writes recreate an output directory removed after first use
+    nested_file = tmp_path / "nested" / "out.txt"
+    sink._send_data(test_data, str(nested_file))
+    nested_file.unlink()
+    nested_file.parent.rmdir()
+    sink._send_data(test_data, str(nested_file))
+    assert nested_file.read_text(encoding="utf-8") == test_data.data
 
-        # Test file reading
-        source = StringFileDataSource()
-        loaded_data = source._get_data(str(test_file))
-        assert loaded_data.data == "Test file content\nWith multiple lines"
-        assert isinstance(loaded_data, StringDataType)
+    # Missing files raise FileNotFoundError
+    with pytest.raises(FileNotFoundError, match="File not found"):
+        source._get_data(str(tmp_path / "missing.txt"))
 
 
 def test_template_extension_payload_components():
@@ -138,38 +186,59 @@ def test_template_extension_payload_components():
     StringPayloadSink.send_payload(payload)
 
 
+def test_component_subpackages_are_imported_lazily():
+    """Test that importing the package does not import component subpackages."""
+
+    code = (
+        "import sys, template_extension\n"
+        "assert 'template_extension.operations' not in sys.modules\n"
+        "assert 'operations' in dir(template_extension)\n"
+        "template_extension.operations\n"
+        "assert 'template_extension.operations' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_extension_registration():
     """Test that the extension can be registered and discovered."""
 
-    from template_extension import TemplateExtension
     from semantiva.registry.processor_registry import ProcessorRegistry
 
-    # Create extension instance
-    extension = TemplateExtension()
-
-    # Test that register method exists and can be called
-    extension.register()  # Should not raise any exceptions
-
-    # Test that some components are now available through ProcessorRegistry
-    # Note: This test verifies the registration pattern works
+    # The session fixture in conftest.py has already called register(); check
+    # that the components are now available through ProcessorRegistry
     registered_modules = ProcessorRegistry.registered_modules()
-    expected_modules = [
+    expected_modules = {
         "template_extension.data_types.data_types",
         "template_extension.operations.operations",
         "template_extension.probes.probes",
         "template_extension.data_io.data_io",
         "template_extension.context_processors.processors",
-    ]
+    }
+
+    missing = expected_modules - set(registered_modules)
+    assert not missing, f"Modules not registered: {sorted(missing)}"
 
-    for module in expected_modules:
-        assert module in registered_modules
+
+def test_extension_reloads_after_registry_clear():
+    """Test that the extension can be loaded again after the registry is reset."""
+
+    from semantiva.registry.plugin_registry import load_extensions
+    from semantiva.registry.processor_registry import ProcessorRegistry
+
+    load_extensions(["template-extension"])
+    ProcessorRegistry.clear()
+    assert "template_extension.operations.operations" not in (
+        ProcessorRegistry.registered_modules()
+    )
+
+    load_extensions(["template-extension"])
+    assert "template_extension.operations.operations" in (
+        ProcessorRegistry.registered_modules()
+    )
+    assert ProcessorRegistry.get_processor("StringDataSource").__name__ == (
+        "StringDataSource"
+    )
 
 
 if __name__ == "__main__":
-    # Run a simple smoke test
-    test_template_extension_components()
-    test_template_extension_context_processors()
-    test_template_extension_file_io()
-    test_template_extension_payload_components()
-    test_extension_registration()
-    print("All tests passed!")
+    pytest.main([__file__, "-v"])